@@ -5,6 +5,8 @@ from django.contrib import admin
 from taxi_app.models import Aggregator, Order, TaxiDriver, TaxiDriverAggregator
 
 ID = 'id'
+TAXI_DRIVER = 'taxi_driver'
+LIST_PER_PAGE = 50
 
 
 @admin.register(Aggregator)
@@ -16,7 +18,10 @@ class AggregatorAdmin(admin.ModelAdmin):
         'name',
         'phone',
     )
+    search_fields = ('name',)
     readonly_fields = (ID,)
+    list_per_page = LIST_PER_PAGE
+    show_full_result_count = False
 
 
 @admin.register(TaxiDriver)
@@ -30,7 +35,10 @@ class TaxiDriverAdmin(admin.ModelAdmin):
         'phone_number',
         'car',
     )
+    search_fields = ('first_name', 'last_name')
     readonly_fields = ('id',)
+    list_per_page = LIST_PER_PAGE
+    show_full_result_count = False
 
 
 @admin.register(TaxiDriverAggregator)
@@ -39,10 +47,14 @@ class TaxiDriverAggregatorAdmin(admin.ModelAdmin):
 
     list_display = (
         ID,
-        'taxi_driver',
+        TAXI_DRIVER,
         'aggregator',
     )
+    list_select_related = (TAXI_DRIVER, 'aggregator')
+    autocomplete_fields = (TAXI_DRIVER, 'aggregator')
     readonly_fields = (ID,)
+    list_per_page = LIST_PER_PAGE
+    show_full_result_count = False
 
 
 @admin.register(Order)
@@ -56,6 +68,10 @@ class OrderAdmin(admin.ModelAdmin):
         'cost',
         'pickup_address',
         'destination_address',
-        'taxi_driver',
+        TAXI_DRIVER,
     )
+    list_select_related = (TAXI_DRIVER,)
+    autocomplete_fields = (TAXI_DRIVER,)
     readonly_fields = (ID,)
+    list_per_page = LIST_PER_PAGE
+    show_full_result_count = False
@@ -8,3 +8,7 @@ class TaxiAppConfig(AppConfig):
 
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'taxi_app'
+
+    def ready(self):
+        """Connect signal handlers of the application."""
+        from taxi_app import authentication, caching  # noqa: F401, WPS433
@@ -0,0 +1,60 @@
+"""Module defining API authentication classes for the application."""
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+CREDENTIALS_KEY = 'auth_credentials:{key}'
+CREDENTIALS_TIMEOUT = 60 * 5
+# Saved on every login, and cannot change whether the token is accepted
+LOGIN_FIELDS = frozenset(('last_login',))
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """Token authentication that keeps resolved tokens in the cache."""
+
+    def authenticate_credentials(self, key):
+        """Return user and token for the key, looking them up in the cache first.
+
+        Args:
+            key (str): Token key sent by the client.
+
+        Returns:
+            tuple: User and token.
+        """
+        cache_key = CREDENTIALS_KEY.format(key=key)
+        credentials = cache.get(cache_key)
+        if credentials is None:
+            credentials = super().authenticate_credentials(key)
+            cache.set(cache_key, credentials, CREDENTIALS_TIMEOUT)
+        return credentials
+
+
+@receiver(post_delete, sender=Token)
+def forget_token(instance, **kwargs) -> None:
+    """Stop accepting a deleted token before its cache entry expires.
+
+    Args:
+        instance (Token): Deleted token.
+        kwargs: Signal arguments.
+    """
+    cache.delete(CREDENTIALS_KEY.format(key=instance.key))
+
+
+@receiver(post_save, sender=User)
+def forget_user_tokens(instance, created, update_fields, **kwargs) -> None:
+    """Drop cached credentials of a changed user, so a deactivated user is rejected at once.
+
+    Args:
+        instance (User): Saved user.
+        created (bool): Whether the user was just created and so has no cached tokens.
+        update_fields (frozenset): Saved fields, None if all of them were saved.
+        kwargs: Signal arguments.
+    """
+    if created or update_fields == LOGIN_FIELDS:
+        return
+    keys = Token.objects.filter(user_id=instance.pk).values_list('key', flat=True)
+    cache.delete_many([CREDENTIALS_KEY.format(key=key) for key in keys])
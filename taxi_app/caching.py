@@ -0,0 +1,86 @@
+"""Module for caching list pages and API list responses of this Django application."""
+
+from functools import wraps
+
+from django.core.cache import caches
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.cache import add_never_cache_headers
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
+from rest_framework.response import Response
+
+from taxi_app.models import Aggregator, Order, TaxiDriver, TaxiDriverAggregator
+
+PAGE_CACHE = 'pages'
+PAGE_TIMEOUT = 60 * 5
+API_LIST_KEY = 'api_list:{path}'
+LIST_CHUNK_SIZE = 500
+
+
+def cache_list_page(view):
+    """Cache rendered page separately for every client cookie set.
+
+    Requests without cookies are not cached: the page would be stored
+    with a CSRF token that does not match the cookie sent to the next client.
+    Browsers are told not to keep the page, so a cleared cache reaches users at once.
+
+    Args:
+        view: View function to be cached.
+
+    Returns:
+        function: View function serving cached responses.
+    """
+    cached_view = cache_page(PAGE_TIMEOUT, cache=PAGE_CACHE)(vary_on_cookie(view))
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if request.COOKIES:
+            response = cached_view(request, *args, **kwargs)
+        else:
+            response = view(request, *args, **kwargs)
+        add_never_cache_headers(response)
+        return response
+    return wrapper
+
+
+class CachedListMixin:
+    """Viewset mixin that caches serialized list responses.
+
+    On a cache miss rows are fetched in chunks, so model instances are
+    not kept in the queryset result cache while the list is serialized.
+    """
+
+    def list(self, request, *args, **kwargs):
+        """Return cached list of objects or build and cache a new one.
+
+        Args:
+            request: Sent request.
+            args: Positional arguments.
+            kwargs: Keyword arguments.
+
+        Returns:
+            Response: Serialized list of objects.
+        """
+        key = API_LIST_KEY.format(path=request.get_full_path())
+        page_cache = caches[PAGE_CACHE]
+        response_data = page_cache.get(key)
+        if response_data is None:
+            queryset = self.filter_queryset(self.get_queryset())
+            rows = queryset.iterator(chunk_size=LIST_CHUNK_SIZE)
+            response_data = self.get_serializer(rows, many=True).data
+            page_cache.set(key, response_data, PAGE_TIMEOUT)
+        return Response(response_data)
+
+
+@receiver([post_save, post_delete], sender=Aggregator)
+@receiver([post_save, post_delete], sender=TaxiDriver)
+@receiver([post_save, post_delete], sender=TaxiDriverAggregator)
+@receiver([post_save, post_delete], sender=Order)
+def clear_page_cache(**kwargs) -> None:
+    """Drop all cached pages after any listed object is saved or deleted.
+
+    Args:
+        kwargs: Signal arguments.
+    """
+    caches[PAGE_CACHE].clear()
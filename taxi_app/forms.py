@@ -1,6 +1,7 @@
 """Module for defining form classes for Aggregator, TaxiDriver and Order models."""
 
 from django import forms
+from django.db import IntegrityError, transaction
 
 from taxi_app.models import Aggregator, Order, TaxiDriver, TaxiDriverAggregator
 
@@ -10,6 +11,10 @@ REQUIRED_FIELD = 'Поле обязательно для заполнения.'
 UNIQUE = 'unique'
 NAME = 'name'
 TAXI_DRIVER = 'taxi_driver'
+AGGREGATOR = 'aggregator'
+FIRST_NAME = 'first_name'
+LAST_NAME = 'last_name'
+AGGREGATOR_EXISTS = 'Вы уже создали агрегатор'
 
 
 class TaxiDriverForm(forms.ModelForm):
@@ -17,19 +22,19 @@ class TaxiDriverForm(forms.ModelForm):
 
     class Meta:
         model = TaxiDriver
-        fields = ['first_name', 'last_name', 'phone_number', 'car']
+        fields = [FIRST_NAME, LAST_NAME, 'phone_number', 'car']
         labels = {
-            'first_name': 'Имя таксиста',
-            'last_name': 'Фамилия таксиста',
+            FIRST_NAME: 'Имя таксиста',
+            LAST_NAME: 'Фамилия таксиста',
             'phone_number': 'Номер телефона',
             'car': 'Марка и номер машины',
         }
         error_messages = {
-            'first_name': {
+            FIRST_NAME: {
                 MAX_LENGTH: 'Имя не должно превышать 50 символов.',
                 REQUIRED: REQUIRED_FIELD,
             },
-            'last_name': {
+            LAST_NAME: {
                 MAX_LENGTH: 'Фамилия не должна превышать 50 символов.',
                 REQUIRED: REQUIRED_FIELD,
             },
@@ -45,6 +50,16 @@ class TaxiDriverForm(forms.ModelForm):
 class OrderForm(forms.ModelForm):
     """Form class for Order module."""
 
+    def __init__(self, *args, **kwargs):
+        """Load only the columns rendered in the taxi driver choices.
+
+        Args:
+            args: Positional form arguments.
+            kwargs: Keyword form arguments.
+        """
+        super().__init__(*args, **kwargs)
+        self.fields[TAXI_DRIVER].queryset = TaxiDriver.objects.only(FIRST_NAME, LAST_NAME)
+
     class Meta:
         model = Order
         fields = [NAME, 'date', 'cost', 'pickup_address', 'destination_address', 'taxi_driver']
@@ -83,6 +98,24 @@ class OrderForm(forms.ModelForm):
 class AggregatorForm(forms.ModelForm):
     """Form class for Aggregator module."""
 
+    def save(self, commit=True):
+        """Save the aggregator, reporting a second one of a non-staff user as a form error.
+
+        Args:
+            commit (bool): Whether the aggregator should be saved to the database.
+
+        Returns:
+            Aggregator | None: The aggregator, None if the user already has one.
+        """
+        if not commit:
+            return super().save(commit=False)
+        try:
+            with transaction.atomic():
+                return super().save()
+        except IntegrityError:
+            self.add_error(None, AGGREGATOR_EXISTS)
+        return None
+
     class Meta:
         model = Aggregator
         fields = [NAME, 'phone']
@@ -107,18 +140,29 @@ class AggregatorForm(forms.ModelForm):
 class TaxiDriverAggregatorForm(forms.ModelForm):
     """Form class for Taxi Driver to Aggregator module."""
 
+    def __init__(self, *args, **kwargs):
+        """Load only the columns rendered in the taxi driver and aggregator choices.
+
+        Args:
+            args: Positional form arguments.
+            kwargs: Keyword form arguments.
+        """
+        super().__init__(*args, **kwargs)
+        self.fields[TAXI_DRIVER].queryset = TaxiDriver.objects.only(FIRST_NAME, LAST_NAME)
+        self.fields[AGGREGATOR].queryset = Aggregator.objects.only(NAME)
+
     class Meta:
         model = TaxiDriverAggregator
-        fields = [TAXI_DRIVER, 'aggregator']
+        fields = [TAXI_DRIVER, AGGREGATOR]
         labels = {
             TAXI_DRIVER: 'Таксист',
-            'aggregator': 'Агрегатор',
+            AGGREGATOR: 'Агрегатор',
         }
         error_messages = {
             TAXI_DRIVER: {
                 REQUIRED: REQUIRED_FIELD,
             },
-            'aggregator': {
+            AGGREGATOR: {
                 REQUIRED: REQUIRED_FIELD,
             },
         }
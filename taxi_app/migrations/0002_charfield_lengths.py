@@ -0,0 +1,69 @@
+# Generated by Django 5.2.18 on 2026-10-14 06:46
+
+import taxi_app.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxi_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='aggregator',
+            name='name',
+            field=models.CharField(max_length=100, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='aggregator',
+            name='phone',
+            field=models.CharField(max_length=15, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='cost',
+            field=models.DecimalField(decimal_places=2, max_digits=10, validators=[taxi_app.models.check_positive]),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='date',
+            field=models.DateTimeField(default=taxi_app.models.get_datetime, validators=[taxi_app.models.validate_future_date]),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='destination_address',
+            field=models.CharField(blank=True, max_length=250, null=True),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='name',
+            field=models.CharField(max_length=100, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='pickup_address',
+            field=models.CharField(blank=True, max_length=250, null=True),
+        ),
+        migrations.AlterField(
+            model_name='taxidriver',
+            name='car',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='taxidriver',
+            name='first_name',
+            field=models.CharField(max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='taxidriver',
+            name='last_name',
+            field=models.CharField(max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='taxidriver',
+            name='phone_number',
+            field=models.CharField(blank=True, max_length=15, null=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-14 06:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxi_app', '0002_charfield_lengths'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['date'], name='taxi_app_or_date_12176e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='taxidriver',
+            index=models.Index(fields=['last_name', 'first_name'], name='taxi_app_ta_last_na_31e7bb_idx'),
+        ),
+    ]
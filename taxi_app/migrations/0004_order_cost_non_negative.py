@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-14 06:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxi_app', '0003_ordering_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='order',
+            constraint=models.CheckConstraint(condition=models.Q(('cost__gte', 0)), name='order_cost_non_negative', violation_error_message='Число не может быть отрицательным'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-14 06:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxi_app', '0004_order_cost_non_negative'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='taxidriveraggregator',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='taxidriveraggregator',
+            constraint=models.UniqueConstraint(fields=('aggregator', 'taxi_driver'), name='taxi_driver_aggregator_unique'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-14 06:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxi_app', '0005_taxi_driver_aggregator_unique'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='aggregator',
+            name='created',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='created',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-14 06:57
+
+import taxi_app.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxi_app', '0006_drop_created_validator'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='aggregator',
+            name='id',
+            field=models.UUIDField(default=taxi_app.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='id',
+            field=models.UUIDField(default=taxi_app.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='taxidriver',
+            name='id',
+            field=models.UUIDField(default=taxi_app.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-14 06:59
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxi_app', '0007_uuid7_primary_keys'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='aggregator',
+            index=models.Index(fields=['user', 'name'], name='taxi_app_ag_user_id_0c36cd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='taxidriver',
+            index=models.Index(fields=['user', 'last_name', 'first_name'], name='taxi_app_ta_user_id_7f4891_idx'),
+        ),
+        migrations.AlterField(
+            model_name='aggregator',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='user'),
+        ),
+        migrations.AlterField(
+            model_name='taxidriver',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='user'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-14 07:11
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def limit_existing_aggregators(apps, schema_editor):
+    Aggregator = apps.get_model('taxi_app', 'Aggregator')
+    oldest = Aggregator.objects.filter(user__is_staff=False).order_by('user_id', 'created')
+    marked_users = set()
+    for aggregator in oldest.only('id', 'user_id').iterator():
+        if aggregator.user_id not in marked_users:
+            marked_users.add(aggregator.user_id)
+            Aggregator.objects.filter(id=aggregator.id).update(limited_to_one=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxi_app', '0008_user_composite_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aggregator',
+            name='limited_to_one',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.RunPython(limit_existing_aggregators, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='aggregator',
+            constraint=models.UniqueConstraint(condition=models.Q(('limited_to_one', True)), fields=('user',), name='aggregator_one_per_user'),
+        ),
+    ]
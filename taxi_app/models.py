@@ -1,21 +1,89 @@
 """This module defines data models of this Django application."""
 
+import time
 from datetime import datetime, timezone
-from uuid import uuid4
+from secrets import randbits
+from uuid import UUID
 
+from asgiref.local import Local
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from django.core.signals import request_finished, request_started
 from django.db import models
+from django.dispatch import receiver
+
+_request_clock = Local()
+
+NS_PER_MS = 10 ** 6
+UUID_VERSION = 0x7
+UUID_VARIANT = 0x2
+# Bit layout of UUID version 7: unix_ts_ms (48) | ver (4) | rand_a (12) | var (2) | rand_b (62)
+UUID_RAND_B_BITS = 62
+UUID_RAND_A_BITS = 12
+UUID_VARIANT_SHIFT = UUID_RAND_B_BITS
+UUID_RAND_A_SHIFT = UUID_VARIANT_SHIFT + 2
+UUID_VERSION_SHIFT = UUID_RAND_A_SHIFT + UUID_RAND_A_BITS
+UUID_TIMESTAMP_SHIFT = UUID_VERSION_SHIFT + 4
+
+
+@receiver(request_started)
+def start_request_clock(**kwargs) -> None:
+    """
+    Enable caching of the current date and time for a new request.
+
+    Args:
+        kwargs: Signal arguments.
+    """
+    _request_clock.active = True
+    _request_clock.now = None
+
+
+@receiver(request_finished)
+def stop_request_clock(**kwargs) -> None:
+    """
+    Drop the cached date and time once the request is finished.
+
+    Args:
+        kwargs: Signal arguments.
+    """
+    _request_clock.active = False
+    _request_clock.now = None
 
 
 def get_datetime() -> datetime:
     """
     Return current date and time.
 
+    Inside a request the value is computed once and reused until the request is finished.
+
     Returns:
         datetime: Current date and time
     """
-    return datetime.now(timezone.utc)
+    if not getattr(_request_clock, 'active', False):
+        return datetime.now(timezone.utc)
+    if _request_clock.now is None:
+        _request_clock.now = datetime.now(timezone.utc)
+    return _request_clock.now
+
+
+def uuid7() -> UUID:
+    """
+    Return a time-ordered UUID version 7.
+
+    The first 48 bits hold Unix time in milliseconds, so new keys are appended
+    to the end of the primary key index instead of random leaf pages.
+
+    Returns:
+        UUID: New UUID version 7
+    """
+    timestamp_ms = time.time_ns() // NS_PER_MS
+    return UUID(int=(
+        timestamp_ms << UUID_TIMESTAMP_SHIFT
+        | UUID_VERSION << UUID_VERSION_SHIFT
+        | randbits(UUID_RAND_A_BITS) << UUID_RAND_A_SHIFT
+        | UUID_VARIANT << UUID_VARIANT_SHIFT
+        | randbits(UUID_RAND_B_BITS)
+    ))
 
 
 def validate_future_date(t_value: datetime) -> None:
@@ -51,7 +119,7 @@ def check_positive(number: int | float) -> None:
 class UUIDMixin(models.Model):
     """A Mixin class that adds UUID to the object by default."""
 
-    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
 
     class Meta:
         abstract = True
@@ -60,16 +128,25 @@ class UUIDMixin(models.Model):
 class CreatedMixin(models.Model):
     """A Mixin class that adds creation date to the object by default."""
 
-    created = models.DateTimeField(auto_now_add=True, validators=[validate_future_date])
+    created = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         abstract = True
 
 
+USER = 'user'
+
+
 class UserMixin(models.Model):
-    """A Mixin class that marks who created the object."""
+    """A Mixin class that marks who created the object.
+
+    The column is not indexed on its own: models using the mixin declare
+    composite indexes that start with user.
+    """
 
-    user = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name='user')
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, verbose_name=USER, db_index=False,
+    )
 
     class Meta:
         abstract = True
@@ -84,8 +161,10 @@ ADDRESS_LENGTH_MAX = 250
 class Aggregator(UUIDMixin, CreatedMixin, UserMixin):
     """Model representing an Aggregator."""
 
-    name = models.TextField(null=False, blank=False, unique=True, max_length=TITLE_LENGTH_MAX)
-    phone = models.TextField(null=False, blank=False, unique=True, max_length=PHONE_LENGTH_MAX)
+    name = models.CharField(null=False, blank=False, unique=True, max_length=TITLE_LENGTH_MAX)
+    phone = models.CharField(null=False, blank=False, unique=True, max_length=PHONE_LENGTH_MAX)
+    # Set for aggregators non-staff users create on the site or API: each of them may own only one
+    limited_to_one = models.BooleanField(default=False, editable=False)
 
     taxi_drivers = models.ManyToManyField('TaxiDriver', through='TaxiDriverAggregator')
 
@@ -100,6 +179,14 @@ class Aggregator(UUIDMixin, CreatedMixin, UserMixin):
 
     class Meta:
         ordering = ['name']
+        indexes = [models.Index(fields=[USER, 'name'])]
+        constraints = [
+            models.UniqueConstraint(
+                fields=[USER],
+                condition=models.Q(limited_to_one=True),
+                name='aggregator_one_per_user',
+            ),
+        ]
         verbose_name = 'Aggregator'
         verbose_name_plural = 'Aggregators'
 
@@ -107,10 +194,10 @@ class Aggregator(UUIDMixin, CreatedMixin, UserMixin):
 class TaxiDriver(UUIDMixin, UserMixin):
     """Model representing a Taxi Driver."""
 
-    first_name = models.TextField(null=False, blank=False, max_length=NAME_LENGTH_MAX)
-    last_name = models.TextField(null=False, blank=False, max_length=NAME_LENGTH_MAX)
-    phone_number = models.TextField(null=True, blank=True, max_length=PHONE_LENGTH_MAX)
-    car = models.TextField(null=True, blank=True, max_length=TITLE_LENGTH_MAX)
+    first_name = models.CharField(null=False, blank=False, max_length=NAME_LENGTH_MAX)
+    last_name = models.CharField(null=False, blank=False, max_length=NAME_LENGTH_MAX)
+    phone_number = models.CharField(null=True, blank=True, max_length=PHONE_LENGTH_MAX)
+    car = models.CharField(null=True, blank=True, max_length=TITLE_LENGTH_MAX)
 
     aggregators = models.ManyToManyField(Aggregator, through='TaxiDriverAggregator')
 
@@ -125,6 +212,10 @@ class TaxiDriver(UUIDMixin, UserMixin):
 
     class Meta:
         ordering = ['last_name', 'first_name']
+        indexes = [
+            models.Index(fields=['last_name', 'first_name']),
+            models.Index(fields=[USER, 'last_name', 'first_name']),
+        ]
         verbose_name = 'Taxi Driver'
         verbose_name_plural = 'Taxi Drivers'
 
@@ -139,17 +230,22 @@ class TaxiDriverAggregator(models.Model):
         ordering = ['aggregator', 'taxi_driver']
         verbose_name = 'Taxi Driver Aggregator Relationship'
         verbose_name_plural = 'Taxi Driver Aggregator Relationships'
-        unique_together = ('taxi_driver', 'aggregator')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['aggregator', 'taxi_driver'],
+                name='taxi_driver_aggregator_unique',
+            ),
+        ]
 
 
 class Order(UUIDMixin, CreatedMixin):
     """Model representing an Order."""
 
-    name = models.TextField(null=False, blank=False, unique=True, max_length=TITLE_LENGTH_MAX)
+    name = models.CharField(null=False, blank=False, unique=True, max_length=TITLE_LENGTH_MAX)
     date = models.DateTimeField(default=get_datetime, validators=[validate_future_date])
     cost = models.DecimalField(max_digits=10, decimal_places=2, validators=[check_positive])
-    pickup_address = models.TextField(null=True, blank=True, max_length=ADDRESS_LENGTH_MAX)
-    destination_address = models.TextField(null=True, blank=True, max_length=ADDRESS_LENGTH_MAX)
+    pickup_address = models.CharField(null=True, blank=True, max_length=ADDRESS_LENGTH_MAX)
+    destination_address = models.CharField(null=True, blank=True, max_length=ADDRESS_LENGTH_MAX)
     taxi_driver = models.ForeignKey(TaxiDriver, on_delete=models.CASCADE, related_name='orders')
 
     def __str__(self):
@@ -165,3 +261,11 @@ class Order(UUIDMixin, CreatedMixin):
         verbose_name = 'Order'
         verbose_name_plural = 'Orders'
         ordering = ['date']
+        indexes = [models.Index(fields=['date'])]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(cost__gte=0),
+                name='order_cost_non_negative',
+                violation_error_message='Число не может быть отрицательным',
+            ),
+        ]
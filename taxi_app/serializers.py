@@ -1,27 +1,48 @@
 """Module defining serializers for the application."""
 
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 
 from taxi_app.models import Aggregator, Order, TaxiDriver, TaxiDriverAggregator
 
 FIELDS_ALL = '__all__'
-USERNAME = 'user.username'
+USERNAME = 'username'
+DATETIME_FIELD = serializers.DateTimeField()
+COST_FIELD = serializers.DecimalField(max_digits=10, decimal_places=2)
 
 
 class AggregatorSerializer(serializers.ModelSerializer):
     """Serializer class for Aggregator model."""
 
-    user = serializers.ReadOnlyField(source=USERNAME)
+    user = serializers.SlugRelatedField(slug_field=USERNAME, read_only=True)
+
+    def create(self, validated_data):
+        """Create the aggregator, rejecting a second one of a non-staff user.
+
+        Args:
+            validated_data (dict): Validated aggregator fields.
+
+        Returns:
+            Aggregator: Created aggregator.
+
+        Raises:
+            ValidationError: If the user already has an aggregator.
+        """
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError:
+            raise serializers.ValidationError('You have already created an aggregator')
 
     class Meta:
         model = Aggregator
-        fields = FIELDS_ALL
+        exclude = ['limited_to_one']
 
 
 class TaxiDriverSerializer(serializers.ModelSerializer):
     """Serializer class for Taxi Driver model."""
 
-    user = serializers.ReadOnlyField(source=USERNAME)
+    user = serializers.SlugRelatedField(slug_field=USERNAME, read_only=True)
 
     class Meta:
         model = TaxiDriver
@@ -31,7 +52,7 @@ class TaxiDriverSerializer(serializers.ModelSerializer):
 class TaxiDriverAggregatorSerializer(serializers.ModelSerializer):
     """Serializer class for Taxi Driver to Aggregator relationship model."""
 
-    user = serializers.ReadOnlyField(source=USERNAME)
+    user = serializers.SlugRelatedField(slug_field=USERNAME, read_only=True)
 
     class Meta:
         model = TaxiDriverAggregator
@@ -41,8 +62,32 @@ class TaxiDriverAggregatorSerializer(serializers.ModelSerializer):
 class OrderSerializer(serializers.ModelSerializer):
     """Serializer class for Order model."""
 
-    user = serializers.ReadOnlyField(source=USERNAME)
+    user = serializers.SlugRelatedField(slug_field=USERNAME, read_only=True)
 
     class Meta:
         model = Order
         fields = FIELDS_ALL
+
+
+class OrderListSerializer(serializers.BaseSerializer):
+    """Read-only serializer for the Order list with the same output as OrderSerializer."""
+
+    def to_representation(self, instance):
+        """Build Order representation without per-field dispatch.
+
+        Args:
+            instance (Order): Order to be serialized.
+
+        Returns:
+            dict: Serialized order.
+        """
+        return {
+            'id': str(instance.id),
+            'created': DATETIME_FIELD.to_representation(instance.created),
+            'name': instance.name,
+            'date': DATETIME_FIELD.to_representation(instance.date),
+            'cost': COST_FIELD.to_representation(instance.cost),
+            'pickup_address': instance.pickup_address,
+            'destination_address': instance.destination_address,
+            'taxi_driver': instance.taxi_driver_id,
+        }
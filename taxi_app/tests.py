@@ -1,216 +1,294 @@
 """Module for testing the whole Django application."""
-from django.contrib.auth import get_user_model
+import time
+import uuid
+
 from django.contrib.auth.models import AnonymousUser, User
-from django.test import Client, RequestFactory, TestCase
+from django.db import IntegrityError, transaction
+from django.test import Client, RequestFactory, SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.authtoken.models import Token
-from rest_framework.test import APIClient
-
-from taxi_app.models import Aggregator, Order, TaxiDriver
-from taxi_app.views import (
-    aggregator_page,
-    aggregators_page,
-    main_page,
-    order_page,
-    orders_page,
-    taxi_driver_page,
-    taxi_drivers_page,
-    UserAdminPermission,
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+
+from taxi_app import caching, views
+from taxi_app.models import (
+    Aggregator,
+    Order,
+    TaxiDriver,
+    get_datetime,
+    start_request_clock,
+    stop_request_clock,
+    uuid7,
 )
 from taxi_app.forms import AggregatorForm
 
+FAST_PASSWORD_HASHERS = ('django.contrib.auth.hashers.MD5PasswordHasher',)
+LIST_ACTIONS = (('get', 'list'), ('post', 'create'))
+DETAIL_ACTIONS = (('get', 'retrieve'), ('put', 'update'), ('delete', 'destroy'))
+AGGREGATORS_URL = '/api/v1/aggregators/'
+# Longer than a millisecond, the resolution of UUID version 7 timestamps
+CLOCK_TICK = 0.002
+
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class TestTask(TestCase):
     """Test Taxi Driver model."""
 
-    _user_creds = {
-        'username': 'test',
-        'password': 'test',
-    }
-
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data for Taxi Driver model."""
-        self.client = APIClient()
-        self.user = User.objects.create(**self._user_creds)
-        self.tocken = Token(user=self.user)
-        self.client.force_authenticate(user=self.user, token=self.tocken)
-        self.superuser = User.objects.create_superuser(
+        cls.superuser = User.objects.create_superuser(
             username='test_admin',
             password='test_admin',
         )
-        self.client.force_authenticate(
-            user=self.superuser,
-            token=Token.objects.create(user=self.superuser),
-        )
-        self.taxi_driver = TaxiDriver.objects.create(
+        cls.superuser_token = Token.objects.create(user=cls.superuser)
+        cls.taxi_driver = TaxiDriver.objects.create(
             first_name='a',
             last_name='a',
             phone_number='+123',
             car='a',
-            user=self.superuser,
+            user=cls.superuser,
         )
-        self.aggregator = Aggregator.objects.create(
+        cls.aggregator = Aggregator.objects.create(
             name='a',
             phone='a',
-            user=self.superuser,
+            user=cls.superuser,
         )
-        self.order = Order.objects.create(
+        cls.order = Order.objects.create(
             name='a',
             date='2024-01-01',
             cost=1,
             pickup_address='a',
             destination_address='a',
-            taxi_driver=self.taxi_driver,
+            taxi_driver=cls.taxi_driver,
         )
 
+    def setUp(self):
+        """Set up API client and request factory for Taxi Driver model."""
+        caching.clear_page_cache()
+        self.client = APIClient()
+        self.factory = APIRequestFactory()
+
     def test_taxi_driver_list(self):
         """Test taxi driver list."""
-        response = self.client.get('/api/v1/taxi_drivers/')
+        with self.assertNumQueries(2):
+            response = self._call(views.TaxiDriverViewSet, 'get')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_taxi_driver_list_cache_cleared(self):
+        """Test cached taxi driver list is rebuilt after a taxi driver is created."""
+        response = self._call(views.TaxiDriverViewSet, 'get')
+        self.assertEqual(len(response.data), 1)
+        TaxiDriver.objects.create(first_name='b', last_name='b', user=self.superuser)
+        response = self._call(views.TaxiDriverViewSet, 'get')
+        self.assertEqual(len(response.data), 2)
+
     def test_taxi_driver_create(self):
         """Test taxi driver create."""
-        response = self.client.post('/api/v1/taxi_drivers/', {
-            'first_name': 'a',
-            'last_name': 'a',
-            'phone_number': '+123',
-            'car': 'a',
-        })
+        taxi_driver = {'first_name': 'a', 'last_name': 'a', 'phone_number': '+123', 'car': 'a'}
+        response = self._call(views.TaxiDriverViewSet, 'post', taxi_driver)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertIn('id', response.data)
-        self.assertIn(
-            response.data['id'],
-            [str(taxi_driver.id) for taxi_driver in TaxiDriver.objects.all()],
-        )
+        self.assertTrue(TaxiDriver.objects.filter(id=response.data['id']).exists())
 
     def test_taxi_driver_update(self):
         """Test taxi driver update."""
-        response = self.client.put(
-            f'/api/v1/taxi_drivers/{self.taxi_driver.id}/', {
-                'first_name': 'b',
-                'last_name': 'b',
-                'phone_number': '+234',
-                'car': 'b',
-            },
-        )
+        taxi_driver = {'first_name': 'b', 'last_name': 'b', 'phone_number': '+234', 'car': 'b'}
+        response = self._call(views.TaxiDriverViewSet, 'put', taxi_driver, self.taxi_driver.id)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('id', response.data)
-        self.assertEqual(TaxiDriver.objects.get(first_name='b').last_name, 'b')
-        self.assertEqual(TaxiDriver.objects.get(last_name='b').first_name, 'b')
-        self.assertEqual(TaxiDriver.objects.get(first_name='b').phone_number, '+234')
-        self.assertEqual(TaxiDriver.objects.get(first_name='b').car, 'b')
+        taxi_driver = TaxiDriver.objects.get(id=self.taxi_driver.id)
+        self.assertEqual(taxi_driver.first_name, 'b')
+        self.assertEqual(taxi_driver.last_name, 'b')
+        self.assertEqual(taxi_driver.phone_number, '+234')
+        self.assertEqual(taxi_driver.car, 'b')
 
     def test_taxi_driver_delete(self):
         """Test taxi driver delete."""
-        response = self.client.delete(f'/api/v1/taxi_drivers/{self.taxi_driver.id}/')
+        response = self._call(views.TaxiDriverViewSet, 'delete', pk=self.taxi_driver.id)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
 
     def test_aggregator_list(self):
         """Test aggregator list."""
-        response = self.client.get('/api/v1/aggregators/')
+        with self.assertNumQueries(2):
+            response = self._call(views.AggregatorViewSet, 'get')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_aggregator_create(self):
         """Test aggregator create."""
-        response = self.client.post('/api/v1/aggregators/', {'name': 'abc', 'phone': '+1234'})
+        aggregator = {'name': 'abc', 'phone': '+1234'}
+        response = self._call(views.AggregatorViewSet, 'post', aggregator)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertIn('id', response.data)
-        self.assertIn(
-            response.data['id'],
-            [str(aggregator.id) for aggregator in Aggregator.objects.all()],
-        )
+        self.assertTrue(Aggregator.objects.filter(id=response.data['id']).exists())
 
     def test_aggregator_update(self):
         """Test aggregator update."""
-        response = self.client.put(
-            f'/api/v1/aggregators/{self.aggregator.id}/',
-            {'name': 'b', 'phone': '+234'},
-        )
+        aggregator = {'name': 'b', 'phone': '+234'}
+        response = self._call(views.AggregatorViewSet, 'put', aggregator, self.aggregator.id)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('id', response.data)
-        self.assertEqual(Aggregator.objects.get(name='b').phone, '+234')
+        aggregator = Aggregator.objects.get(id=self.aggregator.id)
+        self.assertEqual(aggregator.name, 'b')
+        self.assertEqual(aggregator.phone, '+234')
 
     def test_aggregator_delete(self):
         """Test aggregator delete."""
-        response = self.client.delete(f'/api/v1/aggregators/{self.aggregator.id}/')
+        response = self._call(views.AggregatorViewSet, 'delete', pk=self.aggregator.id)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
 
     def test_order_list(self):
         """Test order list."""
-        response = self.client.get('/api/v1/orders/')
+        with self.assertNumQueries(1):
+            response = self._call(views.OrderViewSet, 'get')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_order_create(self):
         """Test order create."""
-        response = self.client.post(
-            '/api/v1/orders/',
-            {
-                'name': 'abc',
-                'date': '2024-01-01',
-                'cost': 1,
-                'pickup_address': 'a',
-                'destination_address': 'a',
-                'taxi_driver': self.taxi_driver.id,
-            },
-        )
+        order = {
+            'name': 'abc',
+            'date': '2024-01-01',
+            'cost': 1,
+            'pickup_address': 'a',
+            'destination_address': 'a',
+            'taxi_driver': self.taxi_driver.id,
+        }
+        response = self._call(views.OrderViewSet, 'post', order)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertIn('id', response.data)
-        self.assertIn(response.data['id'], [str(order.id) for order in Order.objects.all()])
+        self.assertTrue(Order.objects.filter(id=response.data['id']).exists())
 
     def test_order_update(self):
         """Test order update."""
-        response = self.client.put(
-            f'/api/v1/orders/{self.order.id}/',
-            {
-                'name': 'b',
-                'date': '2024-01-02',
-                'cost': 2,
-                'pickup_address': 'b',
-                'destination_address': 'b',
-                'taxi_driver': self.taxi_driver.id,
-            },
-        )
+        order = {
+            'name': 'b',
+            'date': '2024-01-02',
+            'cost': 2,
+            'pickup_address': 'b',
+            'destination_address': 'b',
+            'taxi_driver': self.taxi_driver.id,
+        }
+        response = self._call(views.OrderViewSet, 'put', order, self.order.id)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('id', response.data)
-        self.assertEqual(Order.objects.get(name='b').cost, 2)
-        self.assertEqual(Order.objects.get(pickup_address='b').destination_address, 'b')
-        self.assertEqual(Order.objects.get(date='2024-01-02').cost, 2)
+        order = Order.objects.get(id=self.order.id)
+        self.assertEqual(order.name, 'b')
+        self.assertEqual(order.cost, 2)
+        self.assertEqual(order.pickup_address, 'b')
+        self.assertEqual(order.destination_address, 'b')
+        self.assertEqual(response.data['date'], '2024-01-02T00:00:00+03:00')
 
     def test_order_delete(self):
         """Test order delete."""
-        response = self.client.delete(f'/api/v1/orders/{self.order.id}/')
+        response = self._call(views.OrderViewSet, 'delete', pk=self.order.id)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(Order.objects.filter(id=self.order.id).exists())
 
-    def test_taxi_driver_aggregator_list(self):
-        """Test taxi driver to aggregator list."""
-        response = self.client.get('/api/v1/taxi_driver_aggregators/')
+    def test_order_list_matches_detail(self):
+        """Test order list renders orders the same way as order detail."""
+        list_response = self._call(views.OrderViewSet, 'get')
+        detail_response = self._call(views.OrderViewSet, 'get', pk=self.order.id)
+        self.assertEqual(list_response.data, [detail_response.data])
+
+    def test_order_negative_cost_rejected(self):
+        """Test database rejects negative order cost."""
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                Order.objects.filter(id=self.order.id).update(cost=-1)
+
+    def test_taxi_driver_aggregator_crud(self):
+        """Test list, create and duplicate create of taxi driver to aggregator."""
+        relationship = {
+            'taxi_driver': self.taxi_driver.id,
+            'aggregator': self.aggregator.id,
+        }
+        response = self._call(views.TaxiDriverAggregatorViewSet, 'get')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-
-    def test_create_taxi_driver_aggregator(self):
-        """Test create taxi driver to aggregator."""
-        response = self.client.post(
-            '/api/v1/taxi_driver_aggregators/',
-            {
-             'taxi_driver': self.taxi_driver.id,
-             'aggregator': self.aggregator.id,
-            },
-        )
+        self.assertEqual(response.data, [])
+        response = self._call(views.TaxiDriverAggregatorViewSet, 'post', relationship)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        response = self._call(views.TaxiDriverAggregatorViewSet, 'get')
+        self.assertEqual(len(response.data), 1)
+        response = self._call(views.TaxiDriverAggregatorViewSet, 'post', relationship)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_user_already_exists(self):
         """Test user already exists."""
-        response = self.client.post('/register/', {'username': 'test', 'password': 'test'})
+        response = self.client.post('/register/', {'username': 'test_admin', 'password': 'test'})
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(response.data, {'error': 'User already exists'})
 
-
+    def _call(self, viewset, method, payload=None, pk=None):
+        """Call viewset action directly, skipping URL resolution and middleware.
+
+        The path is only used as the key of cached lists, so one per viewset is enough.
+
+        Args:
+            viewset: Viewset class to be called.
+            method (str): HTTP method of the request.
+            payload (dict): Request body.
+            pk: Primary key of the object for detail actions.
+
+        Returns:
+            Response: Viewset response.
+        """
+        path = f'/{viewset.__name__}/'
+        if pk is not None:
+            path = f'{path}{pk}/'
+        request = getattr(self.factory, method)(path, payload)
+        force_authenticate(request, user=self.superuser, token=self.superuser_token)
+        if pk is None:
+            return viewset.as_view(dict(LIST_ACTIONS))(request)
+        return viewset.as_view(dict(DETAIL_ACTIONS))(request, pk=pk)
+
+
+class GetDatetimeTest(SimpleTestCase):
+    """Tests request-scoped current date and time."""
+
+    def test_cached_during_request(self):
+        """Test the same value is returned until the request is finished."""
+        start_request_clock()
+        self.addCleanup(stop_request_clock)
+        first = get_datetime()
+        time.sleep(CLOCK_TICK)
+        self.assertEqual(get_datetime(), first)
+
+    def test_renewed_for_next_request(self):
+        """Test a new value is returned once the next request is started."""
+        start_request_clock()
+        self.addCleanup(stop_request_clock)
+        first = get_datetime()
+        stop_request_clock()
+        time.sleep(CLOCK_TICK)
+        start_request_clock()
+        self.addCleanup(stop_request_clock)
+        self.assertGreater(get_datetime(), first)
+
+
+class UUID7Test(SimpleTestCase):
+    """Tests time-ordered UUID generation."""
+
+    def test_uuid7(self):
+        """Test UUID version, variant and ordering by creation time."""
+        first = uuid7()
+        time.sleep(CLOCK_TICK)
+        second = uuid7()
+        self.assertEqual(first.version, 7)
+        self.assertEqual(first.variant, uuid.RFC_4122)
+        self.assertLess(first, second)
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class UserRegistrationViewTest(TestCase):
     """Tests user registration view."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data for user registration view."""
+        cls.user = User.objects.create_user(username='test_user', password='password')
+
+    def setUp(self):
+        """Set up client for user registration view."""
         self.client = Client()
 
     def test_registration_new_user(self):
@@ -218,12 +296,12 @@ class UserRegistrationViewTest(TestCase):
         response = self.client.post(
             '/register/',
             {
-                'username': 'test_user',
+                'username': 'new_user',
                 'password': 'test_password',
             },
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        user = get_user_model().objects.get(username='test_user')
+        user = User.objects.get(username='new_user')
         self.assertIsNotNone(user)
         token = Token.objects.get(user=user)
         self.assertEqual(response.json(), {'token': token.key})
@@ -236,8 +314,7 @@ class UserRegistrationViewTest(TestCase):
 
     def test_logout_authenticated_user(self):
         """Test logout authenticated user."""
-        user = get_user_model().objects.create_user(username='test_user', password='test_password')
-        self.client.force_login(user)
+        self.client.force_login(self.user)
         response = self.client.get('/logout/')
         self.assertEqual(response.status_code, status.HTTP_302_FOUND)
         self.assertFalse(response.wsgi_request.user.is_authenticated)
@@ -248,16 +325,17 @@ class UserRegistrationViewTest(TestCase):
         self.assertEqual(response.status_code, status.HTTP_302_FOUND)
         self.assertFalse(response.wsgi_request.user.is_authenticated)
 
-    def test_get_registration(self):
-        """Test get registration."""
+    def test_get_registration_and_login_pages(self):
+        """Test get registration and login pages."""
         response = self.client.get('/register/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertTemplateUsed(response, 'register.html')
+        response = self.client.get(reverse('login'))
+        self.assertTemplateUsed(response, 'login.html')
 
     def test_create_taxi_driver_view(self):
         """Test create taxi driver view."""
-        self.user = User.objects.create_user(username='test_user', password='password')
-        self.client.login(username='test_user', password='password')
+        self.client.force_login(self.user)
         initial_taxi_driver_count = TaxiDriver.objects.count()
         response = self.client.post(reverse('create_taxi_driver'), data={
             'first_name': 'a',
@@ -272,8 +350,7 @@ class UserRegistrationViewTest(TestCase):
 
     def test_delete_taxi_driver(self):
         """Test delete taxi_driver."""
-        self.user = User.objects.create_user(username='test_user', password='password')
-        self.client.login(username='test_user', password='password')
+        self.client.force_login(self.user)
         taxi_driver = TaxiDriver.objects.create(
             first_name='a',
             last_name='a',
@@ -281,15 +358,13 @@ class UserRegistrationViewTest(TestCase):
             car='a',
             user=self.user,
         )
-        initial_taxi_driver_count = TaxiDriver.objects.count()
         response = self.client.post(reverse('delete_taxi_driver', args=[taxi_driver.id]))
         self.assertEqual(response.status_code, status.HTTP_302_FOUND)
-        self.assertEqual(TaxiDriver.objects.count(), initial_taxi_driver_count - 1)
+        self.assertFalse(TaxiDriver.objects.filter(id=taxi_driver.id).exists())
 
     def test_put_taxi_driver(self):
         """Test put taxi driver."""
-        self.user = User.objects.create_user(username='test_user', password='password')
-        self.client.login(username='test_user', password='password')
+        self.client.force_login(self.user)
         taxi_driver = TaxiDriver.objects.create(
             first_name='a',
             last_name='a',
@@ -297,7 +372,6 @@ class UserRegistrationViewTest(TestCase):
             car='a',
             user=self.user,
         )
-        initial_taxi_driver_count = TaxiDriver.objects.count()
         response = self.client.post(reverse('put_taxi_driver', args=[taxi_driver.id]), data={
             'first_name': 'b',
             'last_name': 'b',
@@ -305,14 +379,12 @@ class UserRegistrationViewTest(TestCase):
             'car': 'b',
         })
         self.assertEqual(response.status_code, status.HTTP_302_FOUND)
-        self.assertEqual(TaxiDriver.objects.count(), initial_taxi_driver_count)
         response = self.client.get(reverse('put_taxi_driver', args=[taxi_driver.id]))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_create_order(self):
         """Test create order."""
-        self.user = User.objects.create_user(username='test_user', password='password')
-        self.client.login(username='test_user', password='password')
+        self.client.force_login(self.user)
         taxi_driver = TaxiDriver.objects.create(
             first_name='a',
             last_name='a',
@@ -326,15 +398,16 @@ class UserRegistrationViewTest(TestCase):
             'cost': 2,
             'pickup_address': 'wer',
             'destination_address': 'wer',
-            'taxi_driver': taxi_driver,
+            'taxi_driver': taxi_driver.id,
         })
+        self.assertRedirects(response, reverse('orders_page'))
+        self.assertTrue(Order.objects.filter(name='e', taxi_driver=taxi_driver).exists())
         response = self.client.get(reverse('create_order'))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_delete_order(self):
         """Test delete order."""
-        self.user = User.objects.create_user(username='test_user', password='password')
-        self.client.login(username='test_user', password='password')
+        self.client.force_login(self.user)
         taxi_driver = TaxiDriver.objects.create(
             first_name='a',
             last_name='a',
@@ -350,15 +423,13 @@ class UserRegistrationViewTest(TestCase):
             destination_address='abc',
             taxi_driver=taxi_driver,
         )
-        initial_order_count = Order.objects.count()
         response = self.client.post(reverse('delete_order', args=[order.id]))
         self.assertEqual(response.status_code, status.HTTP_302_FOUND)
-        self.assertEqual(Order.objects.count(), initial_order_count - 1)
+        self.assertFalse(Order.objects.filter(id=order.id).exists())
 
     def test_put_order(self):
         """Test put order."""
-        self.user = User.objects.create_user(username='test_user', password='password')
-        self.client.login(username='test_user', password='password')
+        self.client.force_login(self.user)
         taxi_driver = TaxiDriver.objects.create(
             first_name='a',
             last_name='a',
@@ -374,7 +445,6 @@ class UserRegistrationViewTest(TestCase):
             destination_address='abc',
             taxi_driver=taxi_driver,
         )
-        initial_order_count = Order.objects.count()
         response = self.client.post(reverse('put_order', args=[order.id]), data={
             'name': 'def',
             'date': '2024-01-02',
@@ -384,18 +454,22 @@ class UserRegistrationViewTest(TestCase):
             'taxi_driver': taxi_driver.id,
         })
         self.assertEqual(response.status_code, status.HTTP_302_FOUND)
-        self.assertEqual(Order.objects.count(), initial_order_count)
         response = self.client.get(reverse('put_order', args=[order.id]))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class UserLoginViewTests(TestCase):
     """Tests user login view."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data for user login view."""
+        cls.user = User.objects.create_user(username='user', password='pass')
+
+    def setUp(self):
+        """Set up client for user login view."""
         self.client = Client()
-        self.user = User.objects.create_user(username='user', password='pass')
 
     def test_login_no_username_password(self):
         """Test login no username password."""
@@ -407,13 +481,13 @@ class UserLoginViewTests(TestCase):
         """Test login no user."""
         response = self.client.post(reverse('login'), {'username': 'wrong', 'password': 'pass'})
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(response.json(), {'error': 'User does not exist'})
+        self.assertEqual(response.json(), {'error': 'Invalid username or password'})
 
     def test_login_wrong_password(self):
         """Test login wrong password."""
         response = self.client.post(reverse('login'), {'username': 'user', 'password': 'wrong'})
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(response.json(), {'error': 'Wrong password'})
+        self.assertEqual(response.json(), {'error': 'Invalid username or password'})
 
     def test_login_success(self):
         """Test login success."""
@@ -422,21 +496,62 @@ class UserLoginViewTests(TestCase):
         token = Token.objects.get(user=self.user)
         self.assertEqual(response.json(), {'token': token.key})
 
-    def test_get_login_page(self):
-        """Test get login page."""
-        response = self.client.get(reverse('login'))
-        self.assertTemplateUsed(response, 'login.html')
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class TokenAuthenticationTest(TestCase):
+    """Tests API token authentication."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data for token authentication."""
+        cls.user = User.objects.create_user(username='token_user', password='password')
+        cls.token = Token.objects.create(user=cls.user)
+
+    def setUp(self):
+        """Set up API client for token authentication."""
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def test_token_cached(self):
+        """Test repeated requests with the same token do not query the token table."""
+        self.client.get('/api/v1/orders/')
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/v1/orders/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_deleted_token_rejected(self):
+        """Test a deleted token is not accepted from the cache."""
+        self.client.get('/api/v1/orders/')
+        self.token.delete()
+        response = self.client.get('/api/v1/orders/')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
-class UserAdminPermissionTest(TestCase):
+    def test_deactivated_user_rejected(self):
+        """Test a token of a deactivated user is not accepted from the cache."""
+        self.client.get('/api/v1/orders/')
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get('/api/v1/orders/')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_login_keeps_token_cached(self):
+        """Test saving the last login time does not look up or drop the cached tokens."""
+        self.client.get('/api/v1/orders/')
+        with self.assertNumQueries(1):
+            self.user.save(update_fields=['last_login'])
+        with self.assertNumQueries(0):
+            self.client.get('/api/v1/orders/')
+
+
+class UserAdminPermissionTest(SimpleTestCase):
     """Tests user admin permission."""
 
     def setUp(self):
         """Set up test data for user admin permission."""
         self.factory = RequestFactory()
-        self.permission = UserAdminPermission()
+        self.permission = views.UserAdminPermission()
         self.view = None
-        self.user = User.objects.create_user(username='test_user', password='password')
+        self.user = User(is_staff=False)
 
     def test_has_object_permission(self):
         """Test has object permission."""
@@ -446,96 +561,178 @@ class UserAdminPermissionTest(TestCase):
         self.assertTrue(self.permission.has_object_permission(request, self.view, objc))
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class ViewTestCase(TestCase):
     """Tests views."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data for views."""
-        self.factory = RequestFactory()
-        self.user = User.objects.create_user(username='test_user', password='password')
-        self.taxi_driver = TaxiDriver.objects.create(
+        cls.user = User.objects.create_user(username='test_user', password='password')
+        cls.taxi_driver = TaxiDriver.objects.create(
             first_name='a',
             last_name='a',
             phone_number='+123',
             car='a',
-            user=self.user,
+            user=cls.user,
         )
-        self.aggregator = Aggregator.objects.create(name='a', phone='+123', user=self.user)
-        self.order = Order.objects.create(
+        cls.aggregator = Aggregator.objects.create(name='a', phone='+123', user=cls.user)
+        cls.order = Order.objects.create(
             name='abc',
             date='2024-01-01',
             cost=1,
             pickup_address='abc',
             destination_address='abc',
-            taxi_driver=self.taxi_driver,
+            taxi_driver=cls.taxi_driver,
         )
 
+    def setUp(self):
+        """Set up request factory for views."""
+        self.factory = RequestFactory()
+
     def test_taxi_drivers_page(self):
         """Test taxi drivers page."""
         request = self.factory.get('/taxi_drivers')
-        response = taxi_drivers_page(request)
+        with self.assertNumQueries(3):
+            response = views.taxi_drivers_page(request)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_taxi_driver_page(self):
         """Test taxi driver page."""
         request = self.factory.get(f'/taxi_driver/{self.taxi_driver.id}')
-        response = taxi_driver_page(request, self.taxi_driver.id)
+        with self.assertNumQueries(2):
+            response = views.taxi_driver_page(request, self.taxi_driver.id)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_aggregators_page(self):
         """Test aggregators page."""
         request = self.factory.get('/aggregators')
-        response = aggregators_page(request)
+        with self.assertNumQueries(3):
+            response = views.aggregators_page(request)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_aggregators_page_not_kept_by_browser(self):
+        """Test a page served from the server cache is not cached by the browser."""
+        request = self.factory.get('/aggregators')
+        request.COOKIES['sessionid'] = 'a'
+        views.aggregators_page(request)
+        response = views.aggregators_page(request)
+        self.assertIn('max-age=0', response['Cache-Control'])
+        self.assertIn('private', response['Cache-Control'])
+
     def test_aggregator_page(self):
         """Test aggregator page."""
         request = self.factory.get(f'/aggregator/{self.aggregator.id}')
-        response = aggregator_page(request, self.aggregator.id)
+        with self.assertNumQueries(2):
+            response = views.aggregator_page(request, self.aggregator.id)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_orders_page(self):
         """Test orders page."""
         request = self.factory.get('/orders')
-        response = orders_page(request)
+        with self.assertNumQueries(2):
+            response = views.orders_page(request)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_order_page(self):
         """Test order page."""
         request = self.factory.get(f'/order/{self.order.id}')
-        response = order_page(request, self.order.id)
+        with self.assertNumQueries(1):
+            response = views.order_page(request, self.order.id)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_aggregators_page_paginated(self):
+        """Test aggregators page shows a bounded number of aggregators per page."""
+        Aggregator.objects.bulk_create(
+            Aggregator(name=f'b{number}', phone=f'+2{number}', user=self.user)
+            for number in range(views.LIST_PAGE_SIZE)
+        )
+        request = self.factory.get('/aggregators', {'page': 2})
+        response = views.aggregators_page(request)
+        self.assertContains(response, 'Страница 2 из 2')
+        self.assertContains(response, 'b9')
+        self.assertNotContains(response, 'b0<')
+
+    def test_order_page_not_found(self):
+        """Test order page for a missing order."""
+        response = self.client.get(reverse('order', args=[uuid.uuid4()]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_main_page(self):
         """Test main page."""
         request = self.factory.get('/')
         request.user = AnonymousUser()
-        response = main_page(request)
+        response = views.main_page(request)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class AggregatorViewTest(TestCase):
     """Tests aggregator view."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data for aggregator view."""
+        cls.user = User.objects.create_user(username='test_user', password='test_password')
+        cls.other_user = User.objects.create_user(username='otheruser', password='otherpass')
+        cls.aggregator_data = {'name': 'a', 'phone': '+123', 'user': cls.user}
+
+    def setUp(self):
+        """Set up client for aggregator view."""
         self.client = Client()
-        self.user = User.objects.create_user(username='test_user', password='test_password')
-        self.aggregator_data = {'name': 'a', 'phone': '+123', 'user': self.user}
-        self.aggregator_form = AggregatorForm(data=self.aggregator_data)
 
     def test_create_aggregator(self):
         """Test create aggregator."""
-        self.client.login(username='test_user', password='test_password')
-        form = self.aggregator_form
+        self.client.force_login(self.user)
+        form = AggregatorForm(data=self.aggregator_data)
         if form.is_valid():
             response = self.client.post(reverse('create_aggregator'), data=form.cleaned_data)
             self.assertEqual(response.status_code, status.HTTP_302_FOUND)
             self.assertRedirects(response, reverse('aggregators_page'))
 
+    def test_create_second_aggregator(self):
+        """Test non-staff user cannot create a second aggregator."""
+        self.client.force_login(self.user)
+        self.client.post(reverse('create_aggregator'), data={'name': 'a', 'phone': '+1'})
+        response = self.client.post(
+            reverse('create_aggregator'),
+            data={'name': 'b', 'phone': '+2'},
+        )
+        self.assertContains(response, 'Вы уже создали агрегатор')
+        self.assertEqual(list(Aggregator.objects.values_list('name', flat=True)), ['a'])
+
+    def test_api_create_second_aggregator(self):
+        """Test non-staff user cannot create a second aggregator through the API."""
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        client.post(AGGREGATORS_URL, {'name': 'a', 'phone': '+1'})
+        response = client.post(AGGREGATORS_URL, {'name': 'b', 'phone': '+2'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(list(Aggregator.objects.values_list('name', flat=True)), ['a'])
+
+    def test_admin_add_second_aggregator(self):
+        """Test staff can add more aggregators for a non-staff user in the admin panel."""
+        admin = User.objects.create_superuser(username='test_admin', password='test_admin')
+        self.client.force_login(self.user)
+        self.client.post(reverse('create_aggregator'), {'name': 'a', 'phone': '+1'})
+        self.client.force_login(admin)
+        response = self.client.post(
+            reverse('admin:taxi_app_aggregator_add'),
+            {'name': 'b', 'phone': '+2', 'user': self.user.id},
+        )
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        self.assertEqual(Aggregator.objects.filter(user=self.user).count(), 2)
+
+    def test_create_aggregator_method_not_allowed(self):
+        """Test create aggregator rejects methods other than GET, HEAD and POST."""
+        response = self.client.delete(reverse('create_aggregator'))
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+        response = self.client.head(reverse('create_aggregator'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_create_aggregator_get_form(self):
         """Test create aggregator get form."""
-        self.client.login(username='test_user', password='test_password')
+        self.client.force_login(self.user)
         response = self.client.get(reverse('create_aggregator'))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertTemplateUsed(response, 'forms/create_aggregator.html')
@@ -543,7 +740,7 @@ class AggregatorViewTest(TestCase):
     def test_put_aggregator_get_form(self):
         """Test put aggregator get form."""
         self.aggregator = Aggregator.objects.create(name='a', phone='+123', user=self.user)
-        self.client.login(username='test_user', password='test_password')
+        self.client.force_login(self.user)
         response = self.client.get(reverse('put_aggregator', args=[self.aggregator.id]))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertTemplateUsed(response, 'update/put_aggregator.html')
@@ -551,7 +748,7 @@ class AggregatorViewTest(TestCase):
     def test_delete_aggregator(self):
         """Test delete aggregator."""
         self.aggregator = Aggregator.objects.create(name='a', phone='+1', user=self.user)
-        self.client.login(username='test_user', password='test_password')
+        self.client.force_login(self.user)
         response = self.client.post(reverse('delete_aggregator', args=[self.aggregator.id]))
         self.assertEqual(response.status_code, status.HTTP_302_FOUND)
         self.assertRedirects(response, reverse('aggregators_page'))
@@ -559,8 +756,8 @@ class AggregatorViewTest(TestCase):
     def test_put_aggregator(self):
         """Test put aggregator."""
         self.aggregator = Aggregator.objects.create(name='a', phone='+1', user=self.user)
-        self.client.login(username='test_user', password='test_password')
-        form = self.aggregator_form
+        self.client.force_login(self.user)
+        form = AggregatorForm(data=self.aggregator_data)
         if form.is_valid():
             response = self.client.post(
                 reverse(
@@ -581,7 +778,7 @@ class AggregatorViewTest(TestCase):
     def test_delete_aggregator_no_permission(self):
         """Test delete aggregator no permission."""
         self.aggregator = Aggregator.objects.create(name='a', phone='+1', user=self.user)
-        self.client.login(username='otheruser', password='otherpass')
+        self.client.force_login(self.other_user)
         response = self.client.post(
             reverse(
                 'delete_aggregator',
@@ -604,7 +801,7 @@ class AggregatorViewTest(TestCase):
     def test_put_aggregator_no_permission(self):
         """Test put aggregator no permission."""
         self.aggregator = Aggregator.objects.create(name='b', phone='+3', user=self.user)
-        self.client.login(username='otheruser', password='otherpass')
+        self.client.force_login(self.other_user)
         response = self.client.post(
             reverse(
                 'put_aggregator',
@@ -622,31 +819,35 @@ class AggregatorViewTest(TestCase):
         self.assertEqual(str(messages[0]), 'Вы должны войти в систему, чтобы добавить таксиста')
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class OrderViewTests(TestCase):
     """Tests order view."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data for order view."""
-        self.client = Client()
-        self.user = User.objects.create_user(username='test_user', password='test_password')
-        self.user1 = User.objects.create_user(username='user1', password='pass1')
-        self.taxi_driver = TaxiDriver.objects.create(
+        cls.user1 = User.objects.create_user(username='user1', password='pass1')
+        cls.other_user = User.objects.create_user(username='otheruser', password='otherpass')
+        cls.taxi_driver = TaxiDriver.objects.create(
             first_name='b',
             last_name='b',
             phone_number='+234',
             car='b',
-            user=self.user1,
+            user=cls.user1,
         )
-        self.aggregator1 = Aggregator.objects.create(name='a', phone='+1', user=self.user1)
-        self.order = Order.objects.create(
+        cls.order = Order.objects.create(
             name='abc',
             date='2024-01-01',
             cost=1,
             pickup_address='abc',
             destination_address='abc',
-            taxi_driver=self.taxi_driver,
+            taxi_driver=cls.taxi_driver,
         )
 
+    def setUp(self):
+        """Set up client for order view."""
+        self.client = Client()
+
     def test_create_order_not_authenticated(self):
         """Test create order not authenticated."""
         response = self.client.post(reverse('create_order'))
@@ -654,7 +855,7 @@ class OrderViewTests(TestCase):
 
     def test_delete_order_no_permission(self):
         """Test delete order no permission."""
-        self.client.login(username='otheruser', password='otherpass')
+        self.client.force_login(self.other_user)
         response = self.client.post(reverse('delete_order', args=[self.order.id]), follow=True)
         self.assertRedirects(
             response,
@@ -670,6 +871,6 @@ class OrderViewTests(TestCase):
 
     def test_put_order_no_permission(self):
         """Test put order no permission."""
-        self.client.login(username='otheruser', password='otherpass')
+        self.client.force_login(self.other_user)
         response = self.client.post(reverse('put_order', args=[self.order.id]))
         self.assertContains(response, 'У вас нет прав на изменение этого заказа')
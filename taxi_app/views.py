@@ -1,32 +1,41 @@
 """Module containing views for this Django application."""
 
-from django.contrib import messages
-from django.contrib.auth import authenticate, login, logout
-from django.contrib.auth.models import User
+from django.contrib import auth, messages
+from django.core.paginator import Page, Paginator
+from django.db import IntegrityError, models, transaction
 from django.shortcuts import get_object_or_404, redirect, render
-from rest_framework import permissions, status, viewsets
+from django.views.decorators.http import require_http_methods
+from rest_framework import permissions, status, views, viewsets
 from rest_framework.authtoken.models import Token
 from rest_framework.response import Response
-from rest_framework.views import APIView
 
+from taxi_app.caching import CachedListMixin, cache_list_page
 from taxi_app.forms import AggregatorForm, OrderForm, TaxiDriverForm
 from taxi_app.models import Aggregator, Order, TaxiDriver, TaxiDriverAggregator
-from taxi_app.serializers import AggregatorSerializer, OrderSerializer, TaxiDriverSerializer, TaxiDriverAggregatorSerializer
+from taxi_app.serializers import (
+    AggregatorSerializer,
+    OrderListSerializer,
+    OrderSerializer,
+    TaxiDriverAggregatorSerializer,
+    TaxiDriverSerializer,
+)
 
 ERROR = 'error'
 TITLE = 'title'
 AGGREGATOR = 'aggregator'
 TAXI_DRIVER = 'taxi_driver'
+TAXI_DRIVERS = 'taxi_drivers'
+USER = 'user'
 ORDER = 'order'
 POST = 'POST'
 FORM = 'form'
+FORM_METHODS = ('GET', 'HEAD', POST)
+LIST_PAGE_SIZE = 50
 
 
 class UserAdminPermission(permissions.BasePermission):
     """Defines admin permission."""
 
-    _safe_methods = ['GET', 'HEAD', 'OPTIONS']
-
     def has_permission(self, request, view) -> bool:
         """Ensure that user is authenticated.
 
@@ -50,31 +59,31 @@ class UserAdminPermission(permissions.BasePermission):
         Returns:
             bool: True if user has permission
         """
-        if request.method in self._safe_methods:
+        if request.method in permissions.SAFE_METHODS:
             return True
-        return request.user.is_staff or objec.user == request.user
+        return request.user.is_staff or objec.user_id == request.user.id
 
 
-class AggregatorViewSet(viewsets.ModelViewSet):
+class AggregatorViewSet(CachedListMixin, viewsets.ModelViewSet):
     """Defines viewset for Aggregator module."""
 
-    queryset = Aggregator.objects.all()
+    queryset = Aggregator.objects.select_related(USER).prefetch_related(TAXI_DRIVERS)
     serializer_class = AggregatorSerializer
     permission_classes = [UserAdminPermission]
 
     def perform_create(self, serializer):
-        """Save user who created the aggregator.
+        """Save user who created the aggregator, limiting non-staff users to one.
 
         Args:
             serializer (serializers.Serializer): Serializer object.
         """
-        serializer.save(user=self.request.user)
+        serializer.save(user=self.request.user, limited_to_one=not self.request.user.is_staff)
 
 
-class TaxiDriverViewSet(viewsets.ModelViewSet):
+class TaxiDriverViewSet(CachedListMixin, viewsets.ModelViewSet):
     """Defines viewset for Taxi Driver module."""
 
-    queryset = TaxiDriver.objects.all()
+    queryset = TaxiDriver.objects.select_related(USER).prefetch_related('aggregators')
     serializer_class = TaxiDriverSerializer
     permission_classes = [UserAdminPermission]
 
@@ -87,7 +96,7 @@ class TaxiDriverViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
 
 
-class TaxiDriverAggregatorViewSet(viewsets.ModelViewSet):
+class TaxiDriverAggregatorViewSet(CachedListMixin, viewsets.ModelViewSet):
     """Defines viewset for Taxi Driver Aggregator module."""
 
     queryset = TaxiDriverAggregator.objects.all()
@@ -103,24 +112,34 @@ class TaxiDriverAggregatorViewSet(viewsets.ModelViewSet):
         serializer.save()
 
 
-class OrderViewSet(viewsets.ModelViewSet):
+class OrderViewSet(CachedListMixin, viewsets.ModelViewSet):
     """Defines viewset for Order module."""
 
     queryset = Order.objects.all()
     serializer_class = OrderSerializer
     permission_classes = [UserAdminPermission]
 
+    def get_serializer_class(self):
+        """Use lightweight serializer for listing orders.
+
+        Returns:
+            type: Serializer class for the current action.
+        """
+        if self.action == 'list':
+            return OrderListSerializer
+        return super().get_serializer_class()
+
     def perform_create(self, serializer):
         """Save user who created the order.
 
         Args:
             serializer (serializers.Serializer): Serializer object.
         """
-        taxi_driver = TaxiDriver.objects.get(user=self.request.user)
+        taxi_driver = TaxiDriver.objects.only('id').get(user_id=self.request.user.id)
         serializer.save(taxi_driver=taxi_driver)
 
 
-class UserRegistrationView(APIView):
+class UserRegistrationView(views.APIView):
     """Lets users register in the application."""
 
     permission_classes = [permissions.AllowAny]
@@ -141,13 +160,15 @@ class UserRegistrationView(APIView):
                 {ERROR: 'Username and password are required'},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        user = User.objects.filter(username=username).first()
-        if user is None:
-            user = User.objects.create_user(username=username, password=password)
-            token = Token.objects.create(user=user)
-        else:
+        try:
+            with transaction.atomic():
+                user = auth.get_user_model().objects.create_user(
+                    username=username, password=password,
+                )
+                token = Token.objects.create(user=user)
+                auth.login(request=request, user=user)
+        except IntegrityError:
             return Response({ERROR: 'User already exists'}, status=status.HTTP_400_BAD_REQUEST)
-        login(request=request, user=user)
         return Response({'token': token.key}, status=status.HTTP_200_OK)
 
     def get(self, request):
@@ -162,7 +183,7 @@ class UserRegistrationView(APIView):
         return render(request, 'register.html')
 
 
-class UserLoginView(APIView):
+class UserLoginView(views.APIView):
     """Lets users log in the application."""
 
     permission_classes = [permissions.AllowAny]
@@ -183,15 +204,14 @@ class UserLoginView(APIView):
                 {ERROR: 'Username and password are required'},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        user = User.objects.filter(username=username).first()
+        user = auth.authenticate(request=request, username=username, password=password)
         if user is None:
-            return Response({ERROR: 'User does not exist'}, status=status.HTTP_400_BAD_REQUEST)
-        else:
-            user = authenticate(username=username, password=password)
-            if user is None:
-                return Response({ERROR: 'Wrong password'}, status=status.HTTP_400_BAD_REQUEST)
-            token, _ = Token.objects.get_or_create(user=user)
-        login(request=request, user=user)
+            return Response(
+                {ERROR: 'Invalid username or password'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        token, _ = Token.objects.get_or_create(user=user)
+        auth.login(request=request, user=user)
         return Response({'token': token.key}, status=status.HTTP_200_OK)
 
     def get(self, request):
@@ -216,10 +236,24 @@ def log_out(request):
         HttpResponse: The main page.
     """
     if request.user.is_authenticated:
-        logout(request)
+        auth.logout(request)
     return redirect('main_page')
 
 
+def get_list_page(request, queryset) -> Page:
+    """Return the page of objects requested in the `page` query parameter.
+
+    Args:
+        request: Sent request.
+        queryset (QuerySet): Ordered objects to be paginated.
+
+    Returns:
+        Page: Objects of the requested page, the last page if it is out of range.
+    """
+    return Paginator(queryset, LIST_PAGE_SIZE).get_page(request.GET.get('page'))
+
+
+@cache_list_page
 def main_page(request):
     """Render the main page of the application.
 
@@ -229,23 +263,17 @@ def main_page(request):
     Returns:
         HttpRequest: Loads the main page.
     """
-    pages = {
-        'Агрегаторы': 'aggregators_page',
-        'Таксисты': 'taxi_drivers_page',
-        'Регистрация': 'register',
-        'Получить токен': 'api_token',
-    }
     return render(
         request,
         'main.html',
         context={
-            'page': pages,
             TITLE: 'Главная страница',
-            'user': request.user,
+            USER: request.user,
         },
     )
 
 
+@cache_list_page
 def aggregators_page(request):
     """Render page with the list of Aggregators.
 
@@ -259,7 +287,16 @@ def aggregators_page(request):
         request,
         'aggregators.html',
         context={
-            'aggregators': Aggregator.objects.all(),
+            'aggregators': get_list_page(
+                request,
+                Aggregator.objects.select_related(USER).only(
+                    'name', 'phone', 'user__username',
+                ).prefetch_related(
+                    models.Prefetch(
+                        TAXI_DRIVERS, TaxiDriver.objects.only('first_name', 'last_name'),
+                    ),
+                ),
+            ),
             TITLE: 'Агрегаторы',
         },
     )
@@ -279,12 +316,16 @@ def aggregator_page(request, aggregator_id):
         request,
         'entities/aggregator.html',
         context={
-            AGGREGATOR: Aggregator.objects.get(id=aggregator_id),
+            AGGREGATOR: get_object_or_404(
+                Aggregator.objects.select_related(USER).prefetch_related(TAXI_DRIVERS),
+                id=aggregator_id,
+            ),
             TITLE: 'Агрегатор',
         },
     )
 
 
+@cache_list_page
 def taxi_drivers_page(request):
     """Render page with the list of Taxi Drivers.
 
@@ -298,7 +339,14 @@ def taxi_drivers_page(request):
         request,
         'taxi_drivers.html',
         context={
-            'taxi_drivers': TaxiDriver.objects.all(),
+            TAXI_DRIVERS: get_list_page(
+                request,
+                TaxiDriver.objects.select_related(USER).only(
+                    'first_name', 'last_name', 'phone_number', 'car', 'user__username',
+                ).prefetch_related(
+                    models.Prefetch('orders', Order.objects.only('name', TAXI_DRIVER)),
+                ).order_by('last_name', 'first_name', 'id'),
+            ),
             TITLE: 'Таксисты',
         },
     )
@@ -318,12 +366,16 @@ def taxi_driver_page(request, taxi_driver_id):
         request,
         'entities/taxi_driver.html',
         context={
-            TAXI_DRIVER: TaxiDriver.objects.get(id=taxi_driver_id),
+            TAXI_DRIVER: get_object_or_404(
+                TaxiDriver.objects.select_related(USER).prefetch_related('orders'),
+                id=taxi_driver_id,
+            ),
             TITLE: 'Таксист',
         },
     )
 
 
+@cache_list_page
 def orders_page(request):
     """Render page with the list of Orders.
 
@@ -337,7 +389,17 @@ def orders_page(request):
         request,
         'orders.html',
         context={
-            'orders': Order.objects.all(),
+            'orders': get_list_page(
+                request,
+                Order.objects.select_related(TAXI_DRIVER).only(
+                    'name',
+                    'date',
+                    'pickup_address',
+                    'destination_address',
+                    'taxi_driver__first_name',
+                    'taxi_driver__last_name',
+                ).order_by('date', 'id'),
+            ),
             TITLE: 'Заказы',
         },
     )
@@ -357,12 +419,13 @@ def order_page(request, order_id):
         request,
         'entities/order.html',
         context={
-            ORDER: Order.objects.get(id=order_id),
+            ORDER: get_object_or_404(Order.objects.select_related(TAXI_DRIVER), id=order_id),
             TITLE: 'Заказ',
         },
     )
 
 
+@require_http_methods(FORM_METHODS)
 def create_taxi_driver_view(request):
     """Create a new Taxi Driver.
 
@@ -406,12 +469,13 @@ def delete_taxi_driver(request, taxi_driver_id):
         HttpResponse: Load taxi drivers page.
     """
     taxi_driver = get_object_or_404(TaxiDriver, id=taxi_driver_id)
-    if request.user.is_staff or taxi_driver.user == request.user:
+    if request.user.is_staff or taxi_driver.user_id == request.user.id:
         taxi_driver.delete()
         return redirect('taxi_drivers_page')
     return redirect(TAXI_DRIVER, taxi_driver_id=taxi_driver.id)
 
 
+@require_http_methods(FORM_METHODS)
 def put_taxi_driver(request, taxi_driver_id):
     """Update Taxi Driver.
 
@@ -423,7 +487,7 @@ def put_taxi_driver(request, taxi_driver_id):
         HttpResponse: Load taxi drivers updating page.
     """
     taxi_driver = get_object_or_404(TaxiDriver, id=taxi_driver_id)
-    if request.user.is_staff or taxi_driver.user == request.user:
+    if request.user.is_staff or taxi_driver.user_id == request.user.id:
         if request.method == POST:
             form = TaxiDriverForm(request.POST, instance=taxi_driver)
             if form.is_valid():
@@ -445,6 +509,7 @@ def put_taxi_driver(request, taxi_driver_id):
     )
 
 
+@require_http_methods(FORM_METHODS)
 def create_order(request):
     """Create a new Order.
 
@@ -487,14 +552,15 @@ def delete_order(request, order_id):
     Returns:
         HttpResponse: Load orders page.
     """
-    order = get_object_or_404(Order, id=order_id)
-    if request.user.is_staff or order.taxi_driver.user == request.user:
+    order = get_object_or_404(Order.objects.select_related(TAXI_DRIVER), id=order_id)
+    if request.user.is_staff or order.taxi_driver.user_id == request.user.id:
         order.delete()
         return redirect('orders_page')
     messages.error(request, 'У вас нет прав на удаление этого заказа')
     return redirect(ORDER, order_id=order.id)
 
 
+@require_http_methods(FORM_METHODS)
 def put_order(request, order_id):
     """Update Order.
 
@@ -505,8 +571,8 @@ def put_order(request, order_id):
     Returns:
         HttpResponse: Load orders updating page.
     """
-    order = get_object_or_404(Order, id=order_id)
-    if request.user.is_staff or order.taxi_driver.user == request.user:
+    order = get_object_or_404(Order.objects.select_related(TAXI_DRIVER), id=order_id)
+    if request.user.is_staff or order.taxi_driver.user_id == request.user.id:
         if request.method == POST:
             form = OrderForm(request.POST, instance=order)
             if form.is_valid():
@@ -528,6 +594,7 @@ def put_order(request, order_id):
     )
 
 
+@require_http_methods(FORM_METHODS)
 def create_aggregator(request):
     """Create a new Aggregator.
 
@@ -539,16 +606,10 @@ def create_aggregator(request):
     """
     if request.user.is_authenticated:
         if request.method == POST:
-            form = AggregatorForm(request.POST)
-            if form.is_valid():
-                users_aggregators = Aggregator.objects.filter(user=request.user).exists()
-                if not request.user.is_staff and users_aggregators:
-                    messages.error(request, 'Вы уже создали агрегатор')
-                else:
-                    aggregator = form.save(commit=False)
-                    aggregator.user = request.user
-                    aggregator.save()
-                    return redirect('aggregators_page')
+            aggregator = Aggregator(user=request.user, limited_to_one=not request.user.is_staff)
+            form = AggregatorForm(request.POST, instance=aggregator)
+            if form.is_valid() and form.save():
+                return redirect('aggregators_page')
         else:
             form = AggregatorForm()
     else:
@@ -576,13 +637,14 @@ def delete_aggregator(request, aggregator_id):
         HttpResponse: Load aggregators page.
     """
     aggregator = get_object_or_404(Aggregator, id=aggregator_id)
-    if request.user.is_staff or aggregator.user == request.user:
+    if request.user.is_staff or aggregator.user_id == request.user.id:
         aggregator.delete()
         return redirect('aggregators_page')
     messages.error(request, 'У вас нет прав на удаление этого агрегатора')
     return redirect(AGGREGATOR, aggregator_id=aggregator.id)
 
 
+@require_http_methods(FORM_METHODS)
 def put_aggregator(request, aggregator_id):
     """Update Aggregator.
 
@@ -594,7 +656,7 @@ def put_aggregator(request, aggregator_id):
         HttpResponse: Load aggregators updating page.
     """
     aggregator = get_object_or_404(Aggregator, id=aggregator_id)
-    if request.user.is_staff or aggregator.user == request.user:
+    if request.user.is_staff or aggregator.user_id == request.user.id:
         if request.method == POST:
             form = AggregatorForm(request.POST, instance=aggregator)
             if form.is_valid():